@@ -0,0 +1,152 @@
+"""batch.py
+
+Implement the FixedIntArray helper for bulk fixed-size arithmetic on
+NumPy arrays.  The kernels are compiled with Numba when it is
+installed and otherwise run as plain vectorized NumPy expressions.
+"""
+
+from typing import Any, Callable
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """Stand-in for `numba.njit` that leaves the function as is."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+
+_UINT64_MASK = (1 << 64) - 1
+_INT64_LIMIT = float(1 << 63)
+
+# All kernels operate on uint64 arrays so that overflow wraps around
+# instead of being promoted, and so Numba never unifies mixed signed
+# and unsigned operands into float64.  `sign_mask` is 0 for unsigned
+# arrays, which makes the sign extension a no-op.
+
+@njit(cache=True)
+def _sign_extend(values: np.ndarray,
+                 mask: np.uint64,
+                 sign_mask: np.uint64
+                 ) -> np.ndarray:
+    return np.where((values & sign_mask) != 0, values | ~mask, values)
+
+
+@njit(cache=True)
+def _wrap_fixed(values: np.ndarray,
+                mask: np.uint64,
+                sign_mask: np.uint64
+                ) -> np.ndarray:
+    return _sign_extend(values & mask, mask, sign_mask)
+
+
+@njit(cache=True)
+def _add_fixed(a: np.ndarray,
+               b: np.ndarray,
+               mask: np.uint64,
+               sign_mask: np.uint64
+               ) -> np.ndarray:
+    return _sign_extend((a + b) & mask, mask, sign_mask)
+
+
+@njit(cache=True)
+def _sub_fixed(a: np.ndarray,
+               b: np.ndarray,
+               mask: np.uint64,
+               sign_mask: np.uint64
+               ) -> np.ndarray:
+    return _sign_extend((a - b) & mask, mask, sign_mask)
+
+
+@njit(cache=True)
+def _mul_fixed(a: np.ndarray,
+               b: np.ndarray,
+               mask: np.uint64,
+               sign_mask: np.uint64
+               ) -> np.ndarray:
+    return _sign_extend((a * b) & mask, mask, sign_mask)
+
+
+class FixedIntArray:
+    """
+    Batch counterpart of the `FixedInt()` class factory.  Instead of
+    wrapping individual numbers, it applies fixed-size overflow to
+    whole arrays at once::
+
+        Int12Array = FixedIntArray(12, signed=True)
+        Int12Array.add(np.array([2047, -5]), np.array([1, 3]))
+        # array([-2048, -2])
+
+    Results are int64 arrays for signed sizes and uint64 arrays for
+    unsigned sizes.  Sizes are limited to 64 bits.
+    """
+
+    def __init__(self, size: int, signed: bool) -> None:
+        if not (isinstance(size, int) and 0 < size <= 64):
+            raise ValueError("Number of bits must be an integer in [1, 64].")
+        self.SIZE = size
+        self.SIGNED = signed
+        self._mask = np.uint64((1 << size) - 1)
+        self._sign_mask = np.uint64(1 << (size - 1) if signed else 0)
+
+    def __repr__(self) -> str:
+        return f"FixedIntArray(size={self.SIZE}, signed={self.SIGNED})"
+
+    def wrap(self, values: Any) -> np.ndarray:
+        """Truncate and sign-extend values to this array's size."""
+        result = _wrap_fixed(self._as_bits(values),
+                             self._mask, self._sign_mask)
+        return self._as_result(result)
+
+    def add(self, a: Any, b: Any) -> np.ndarray:
+        return self._apply(_add_fixed, a, b)
+
+    def sub(self, a: Any, b: Any) -> np.ndarray:
+        return self._apply(_sub_fixed, a, b)
+
+    def mul(self, a: Any, b: Any) -> np.ndarray:
+        return self._apply(_mul_fixed, a, b)
+
+    def _apply(self,
+               kernel: Callable[..., np.ndarray],
+               a: Any,
+               b: Any
+               ) -> np.ndarray:
+        a_bits, b_bits = np.broadcast_arrays(self._as_bits(a),
+                                             self._as_bits(b))
+        result = kernel(np.ascontiguousarray(a_bits),
+                        np.ascontiguousarray(b_bits),
+                        self._mask, self._sign_mask)
+        return self._as_result(result)
+
+    def _as_bits(self, values: Any) -> np.ndarray:
+        array = np.atleast_1d(np.asarray(values))
+        kind = array.dtype.kind
+        if kind == "f":
+            # Casting floats straight to uint64 is undefined for negative
+            # values, so truncate toward zero like int() and go through
+            # int64.  Floats outside the int64 range (and NaN or
+            # infinity) take the int() path below instead.
+            array = np.trunc(array)
+            if np.all(np.abs(array) < _INT64_LIMIT):
+                return array.astype(np.int64).astype(np.uint64)
+            array = array.astype(object)
+            kind = "O"
+        if kind == "O":
+            # Python ints too large for any NumPy integer type.  Keep
+            # their lower 64 bits like FixedInt() would.
+            bits = [int(value) & _UINT64_MASK for value in array.flat]
+            array = np.array(bits, dtype=np.uint64).reshape(array.shape)
+        elif kind not in "biu":
+            raise TypeError(f"Unsupported array dtype: {array.dtype}")
+        # Integer casts wrap negative numbers around to their Two's
+        # complement bit patterns.
+        return array.astype(np.uint64)
+
+    def _as_result(self, bits: np.ndarray) -> np.ndarray:
+        if self.SIGNED:
+            return bits.view(np.int64)
+        return bits
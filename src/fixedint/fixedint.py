@@ -3,11 +3,13 @@
 Implement the FixedInt class factory.
 """
 
-from abc import ABCMeta, abstractmethod
+from functools import partial
 from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
 
+T = TypeVar("T")
 
-class FixedIntType(int, metaclass=ABCMeta):
+
+class FixedIntType(int):
     """
     Proxy base class for the internal `FixedIntInstance` class defined
     and returned from `FixedInt()`.  This class is made available for
@@ -16,16 +18,11 @@ class FixedIntType(int, metaclass=ABCMeta):
         fixed_num = FixedInt(12)(65)
         if isinstance(fixed_num, FixedIntType):
             print("fixed_num is a fixed size integer.")
-
-    This class is also a singleton class manager for all
-    `FixedIntInstance` classes created during runtime.  This ensures
-    that the classes of numbers with the same (size, signed) properties
-    are one and the same::
-
-        num1 = FixedInt(36, signed=False)(450)
-        num2 = FixedInt(36, signed=False)(2744)
-        print(type(num1) is type(num2))  # True
     """
+    # Instances only ever hold their int value, so don't give them a
+    # __dict__.  Subclasses must declare empty __slots__ as well.
+    __slots__ = ()
+
     # Define interface of a FixedIntInstance so clients using the
     # FixedIntType type hint do not get errors.
 
@@ -34,31 +31,46 @@ class FixedIntType(int, metaclass=ABCMeta):
     MAX_VALUE: int = NotImplemented
     MIN_VALUE: int = NotImplemented
 
-    @abstractmethod
-    def __init__(self, value: int) -> None:
-        pass
+    def __new__(cls, *args: Any, **kwargs: Any) -> "FixedIntType":
+        # Only the classes created by FixedInt() can be instantiated.
+        if cls is FixedIntType:
+            raise TypeError("FixedIntType cannot be instantiated directly; "
+                            "use a class created by FixedInt().")
+        return super().__new__(cls, *args, **kwargs)
 
-    @abstractmethod
     def as_binary(self) -> str:
-        pass
+        raise NotImplementedError(
+            f"{type(self).__name__} was not created by FixedInt()")
 
-    @abstractmethod
     def as_decimal(self) -> int:
-        pass
+        raise NotImplementedError(
+            f"{type(self).__name__} was not created by FixedInt()")
+
+
+# Singleton management of all `FixedIntInstance` classes created during
+# runtime.  This ensures that the classes of numbers with the same
+# (size, signed) properties are one and the same::
+#
+#     num1 = FixedInt(36, signed=False)(450)
+#     num2 = FixedInt(36, signed=False)(2744)
+#     print(type(num1) is type(num2))  # True
+
+_classes: Dict[Tuple[int, bool], Type[FixedIntType]] = {}
+
+
+def _get_fixedint_class(size: int, signed: bool
+                        ) -> Optional[Type[FixedIntType]]:
+    return _classes.get((size, signed))
 
-    # Singleton management here.
 
-    _classes: Dict[Tuple[int, bool], Type["FixedIntType"]] = {}
+def _register_fixedint_class(new_cls: Type[FixedIntType]) -> None:
+    key = (new_cls.SIZE, new_cls.SIGNED)
+    _classes[key] = new_cls
 
-    @classmethod
-    def get_class(cls, size: int, signed: bool
-                  ) -> Optional[Type["FixedIntType"]]:
-        return cls._classes.get((size, signed))
 
-    @classmethod
-    def add_class(cls, new_cls: Type["FixedIntType"]) -> None:
-        key = (new_cls.SIZE, new_cls.SIGNED)
-        cls._classes[key] = new_cls
+# Classes up to this many bits preallocate an instance for every value
+# they can hold, so constructing one of them never allocates.
+_INTERNED_VALUES_MAX_SIZE = 8
 
 
 def FixedInt(size: int, signed: bool) -> Type[FixedIntType]:
@@ -68,35 +80,37 @@ def FixedInt(size: int, signed: bool) -> Type[FixedIntType]:
         raise ValueError("Number of bits must be a positive integer.")
 
     # Class already interned
-    cls =  FixedIntType.get_class(size, signed)
+    cls = _get_fixedint_class(size, signed)
     if cls is not None:
         return cls
 
-    def calculate_max_value() -> int:
-        umax = (1 << size) - 1
-        if signed:
-            msb_mask = (1 << (size - 1))
-            tmax = msb_mask - 1
-            return tmax
-        return umax
-
-    def calculate_min_value() -> int:
-        if signed:
-            return -(1 << (size - 1))
-        return 0
-
-    T = TypeVar("T")
+    # Bit patterns shared by every instance of this class.
+    mask = (1 << size) - 1
+    msb_mask = 1 << (size - 1)
+    modulus = mask + 1
+    binary_format = f"0{size}b"
 
     class FixedIntInstance(FixedIntType):
+        __slots__ = ()
+
         SIZE: int = size
         SIGNED: bool = signed
-        MAX_VALUE: int = calculate_max_value()
-        MIN_VALUE: int = calculate_min_value()
+        MAX_VALUE: int = msb_mask - 1 if signed else mask
+        MIN_VALUE: int = -msb_mask if signed else 0
 
         def __new__(cls, value: int) -> "FixedIntInstance":
-            lower_size_ones = (1 << size) - 1
-            lower_bits = int(value) & lower_size_ones
-            return super().__new__(cls, lower_bits)
+            if type(value) is not int:
+                # Other FixedInts convert by their decimal value, the
+                # same as int() does, so narrower signed numbers are
+                # sign-extended rather than zero-extended.
+                if isinstance(value, FixedIntType):
+                    value = value.as_decimal()
+                else:
+                    value = int(value)
+            lower_bits = value & mask
+            if interned_values and cls is FixedIntInstance:
+                return interned_values[lower_bits]
+            return int.__new__(cls, lower_bits)
 
         def __repr__(self) -> str:
             param_list = f"size={self.SIZE}, signed={self.SIGNED}"
@@ -106,119 +120,205 @@ def FixedInt(size: int, signed: bool) -> Type[FixedIntType]:
         def __str__(self) -> str:
             return str(self.as_decimal())
 
-        def __eq__(self, other: Any) -> bool:
-            return self.as_decimal() == other
-
-        def __lt__(self, other: Any) -> bool:
-            return self.as_decimal() < other
+        def __hash__(self) -> int:
+            return hash(self.as_decimal())
 
-        def __gt__(self, other: Any) -> bool:
-            return self.as_decimal() > other
+        def __int__(self) -> int:
+            return self.as_decimal()
 
-        def __le__(self, other: Any) -> bool:
-            return self.as_decimal() <= other
+        # NOTE: Comparisons inline the sign extension of as_decimal()
+        # since they are by far the most frequently called methods.
+        # Like as_decimal(), they are specialized on signedness once
+        # here instead of checking it on every call.
 
-        def __ge__(self, other: Any) -> bool:
-            return self.as_decimal() >= other
+        if signed:
+            def __eq__(self, other: Any) -> bool:
+                value = self.real
+                if value & msb_mask:
+                    value -= modulus
+                return value == other
+
+            def __ne__(self, other: Any) -> bool:
+                value = self.real
+                if value & msb_mask:
+                    value -= modulus
+                return value != other
+
+            def __lt__(self, other: Any) -> bool:
+                value = self.real
+                if value & msb_mask:
+                    value -= modulus
+                return value < other
+
+            def __gt__(self, other: Any) -> bool:
+                value = self.real
+                if value & msb_mask:
+                    value -= modulus
+                return value > other
+
+            def __le__(self, other: Any) -> bool:
+                value = self.real
+                if value & msb_mask:
+                    value -= modulus
+                return value <= other
+
+            def __ge__(self, other: Any) -> bool:
+                value = self.real
+                if value & msb_mask:
+                    value -= modulus
+                return value >= other
+        else:
+            def __eq__(self, other: Any) -> bool:
+                return self.real == other
+
+            def __ne__(self, other: Any) -> bool:
+                return self.real != other
+
+            def __lt__(self, other: Any) -> bool:
+                return self.real < other
+
+            def __gt__(self, other: Any) -> bool:
+                return self.real > other
+
+            def __le__(self, other: Any) -> bool:
+                return self.real <= other
+
+            def __ge__(self, other: Any) -> bool:
+                return self.real >= other
+
+        # NOTE: Any number with a `real` part can be an operand, but
+        # the int/float check comes first so the common case never
+        # needs the slower attribute lookup.
+        #
+        # NOTE: Operations between two instances of this same class take
+        # a fast path that skips the generic coercion in __new__, since
+        # both operands are known to be in range already.  True division
+        # produces a float and always goes through the generic path.
+        #
+        # FixedInt operands of other classes take part by their decimal
+        # value, the same as when constructing from them or calling
+        # int() on them.  Likewise, the reflected operators return a
+        # number of the other operand's type, so they use this number's
+        # decimal value rather than its raw bits.
 
         def __add__(self, other: Any) -> "FixedIntInstance":
-            return operation_wrapper(self, other,
-                                     lambda x, y: x + y,
-                                     self.__class__)
+            if type(other) is FixedIntInstance:
+                return from_bits((self.real + other.real) & mask)
+            if isinstance(other, FixedIntType):
+                return FixedIntInstance(self.real + other.as_decimal())
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return FixedIntInstance(self.real + other.real)
+            return NotImplemented
 
         def __radd__(self, other: T) -> T:
-            return operation_wrapper(self, other,
-                                     lambda x, y: y + x,
-                                     other.__class__)
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return other.__class__(other.real + self.as_decimal())
+            return NotImplemented
 
         def __sub__(self, other: Any) -> "FixedIntInstance":
-            return operation_wrapper(self, other,
-                                     lambda x, y: x - y,
-                                     self.__class__)
+            if type(other) is FixedIntInstance:
+                return from_bits((self.real - other.real) & mask)
+            if isinstance(other, FixedIntType):
+                return FixedIntInstance(self.real - other.as_decimal())
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return FixedIntInstance(self.real - other.real)
+            return NotImplemented
 
         def __rsub__(self, other: T) -> T:
-            return operation_wrapper(self, other,
-                                     lambda x, y: y - x,
-                                     other.__class__)
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return other.__class__(other.real - self.as_decimal())
+            return NotImplemented
 
         def __mul__(self, other: Any) -> "FixedIntInstance":
-            return operation_wrapper(self, other,
-                                     lambda x, y: x * y,
-                                     self.__class__)
+            if type(other) is FixedIntInstance:
+                return from_bits((self.real * other.real) & mask)
+            if isinstance(other, FixedIntType):
+                return FixedIntInstance(self.real * other.as_decimal())
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return FixedIntInstance(self.real * other.real)
+            return NotImplemented
 
         def __rmul__(self, other: T) -> T:
-            return operation_wrapper(self, other,
-                                     lambda x, y: y * x,
-                                     other.__class__)
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return other.__class__(other.real * self.as_decimal())
+            return NotImplemented
 
         def __truediv__(self, other: Any) -> "FixedIntInstance":
-            return operation_wrapper(self, other,
-                                     lambda x, y: x / y,
-                                     self.__class__)
+            if type(other) is FixedIntInstance:
+                return FixedIntInstance(self.real / other.real)
+            if isinstance(other, FixedIntType):
+                return FixedIntInstance(self.real / other.as_decimal())
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return FixedIntInstance(self.real / other.real)
+            return NotImplemented
 
         def __rtruediv__(self, other: T) -> T:
-            return operation_wrapper(self, other,
-                                     lambda x, y: y / x,
-                                     other.__class__)
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return other.__class__(other.real / self.as_decimal())
+            return NotImplemented
 
         def __floordiv__(self, other: Any) -> "FixedIntInstance":
-            return operation_wrapper(self, other,
-                                     lambda x, y: x // y,
-                                     self.__class__)
+            if type(other) is FixedIntInstance:
+                return from_bits((self.real // other.real) & mask)
+            if isinstance(other, FixedIntType):
+                return FixedIntInstance(self.real // other.as_decimal())
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return FixedIntInstance(self.real // other.real)
+            return NotImplemented
 
         def __rfloordiv__(self, other: T) -> T:
-            return operation_wrapper(self, other,
-                                     lambda x, y: y // x,
-                                     other.__class__)
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return other.__class__(other.real // self.as_decimal())
+            return NotImplemented
 
         def __mod__(self, other: Any) -> "FixedIntInstance":
-            return operation_wrapper(self, other,
-                                     lambda x, y: x % y,
-                                     self.__class__)
+            if type(other) is FixedIntInstance:
+                return from_bits((self.real % other.real) & mask)
+            if isinstance(other, FixedIntType):
+                return FixedIntInstance(self.real % other.as_decimal())
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return FixedIntInstance(self.real % other.real)
+            return NotImplemented
 
         def __rmod__(self, other: T) -> T:
-            return operation_wrapper(self, other,
-                                     lambda x, y: y % x,
-                                     other.__class__)
+            if isinstance(other, (int, float)) or hasattr(other, "real"):
+                return other.__class__(other.real % self.as_decimal())
+            return NotImplemented
 
         def __neg__(self) -> "FixedIntInstance":
-            twos_complement = ~self.real + 1
-            return self.__class__(twos_complement)
+            return FixedIntInstance(modulus - self.real)
 
         def __abs__(self) -> "FixedIntInstance":
-            return self.__class__(abs(self.as_decimal()))
+            return FixedIntInstance(abs(self.as_decimal()))
 
         # NOTE: More operations may need to be overridden, and the above
         # operations may not be fully tested.
 
-        def as_decimal(self) -> int:
-            if not signed:
+        if signed:
+            def as_decimal(self) -> int:
+                if self.real & msb_mask:
+                    return self.real - modulus
+                return self.real
+        else:
+            def as_decimal(self) -> int:
                 return self.real
-            msb_mask = (1 << (size - 1))
-            msb = self.real & msb_mask
-            if msb:
-                all_ones = (1 << size) - 1
-                magnitude = -self.real & all_ones
-                return -magnitude
-            return self.real
 
         def as_binary(self) -> str:
-            # NOTE: str.removeprefix was not added until 3.9
-            return bin(self)[2:].zfill(self.SIZE)
-
-    def operation_wrapper(left: Any,
-                          right: Any,
-                          binary_operation: Callable[[Any, Any], Any],
-                          cls: Type[T]
-                          ) -> T:
-        """Perform a binary operation between two int-like instances."""
-        try:
-            return cls(binary_operation(left.real, right.real))
-        except AttributeError:
-            return NotImplemented
+            return format(self.real, binary_format)
+
+    interned_values: Tuple[FixedIntInstance, ...] = ()
+    if size <= _INTERNED_VALUES_MAX_SIZE:
+        interned_values = tuple(int.__new__(FixedIntInstance, bits)
+                                for bits in range(modulus))
+
+    from_bits: Callable[[int], FixedIntInstance]
+    if interned_values:
+        from_bits = interned_values.__getitem__
+    else:
+        from_bits = partial(int.__new__, FixedIntInstance)
 
     # Intern the class we just defined
-    FixedIntType.add_class(FixedIntInstance)
+    _register_fixedint_class(FixedIntInstance)
 
     return FixedIntInstance
 
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""test_batch.py
+
+Unit tester program for the FixedIntArray batch helper.
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from fixedint import FixedInt
+
+__author__ = "Vincent Lin"
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestFixedIntArray(unittest.TestCase):
+    def setUp(self) -> None:
+        from fixedint.batch import FixedIntArray
+        self.Int8Array = FixedIntArray(8, signed=True)
+        self.UInt8Array = FixedIntArray(8, signed=False)
+        self.Int64Array = FixedIntArray(64, signed=True)
+
+    def test_invalid_sizes(self) -> None:
+        from fixedint.batch import FixedIntArray
+        with self.assertRaises(ValueError):
+            FixedIntArray(0, signed=True)
+        with self.assertRaises(ValueError):
+            FixedIntArray(65, signed=True)
+
+    def test_wrap(self) -> None:
+        result = self.Int8Array.wrap([200, -300, 5])
+        self.assertEqual(result.tolist(), [-56, -44, 5])
+        self.assertEqual(result.dtype, np.int64)
+
+    def test_wrap_unsigned(self) -> None:
+        result = self.UInt8Array.wrap([200, -1, 256])
+        self.assertEqual(result.tolist(), [200, 255, 0])
+        self.assertEqual(result.dtype, np.uint64)
+
+    def test_wrap_floats(self) -> None:
+        result = self.Int8Array.wrap([-1.5, 2.7, 200.9])
+        self.assertEqual(result.tolist(), [-1, 2, -56])
+        result = self.UInt8Array.wrap(np.array([-1.5, 255.9]))
+        self.assertEqual(result.tolist(), [255, 255])
+
+    def test_wrap_big_floats(self) -> None:
+        from fixedint.batch import FixedIntArray
+        UInt64Array = FixedIntArray(64, signed=False)
+        for value in (1.5e19, -1.5e19, 1e30):
+            expected = FixedInt(64, signed=False)(value)
+            self.assertEqual(UInt64Array.wrap([value]).tolist(), [expected])
+            expected = FixedInt(64, signed=True)(value)
+            self.assertEqual(self.Int64Array.wrap([value]).tolist(),
+                             [expected])
+        self.assertEqual(self.UInt8Array.wrap([1e30, 300.5]).tolist(),
+                         [0, 44])
+
+    def test_wrap_big_ints(self) -> None:
+        result = self.UInt8Array.wrap([(1 << 70) + 5, -(1 << 70) - 1])
+        self.assertEqual(result.tolist(), [5, 255])
+
+    def test_wrap_invalid_dtype(self) -> None:
+        with self.assertRaises(TypeError):
+            self.Int8Array.wrap(["1", "2"])
+
+    def test_add_overflow(self) -> None:
+        result = self.Int8Array.add([100, -100], [150, -150])
+        self.assertEqual(result.tolist(), [-6, 6])
+
+    def test_int64_overflow(self) -> None:
+        int64_max = (1 << 63) - 1
+        result = self.Int64Array.add([int64_max], [1])
+        self.assertEqual(result.tolist(), [-(1 << 63)])
+
+    def test_broadcast_scalar(self) -> None:
+        result = self.UInt8Array.sub([0, 1, 2], 1)
+        self.assertEqual(result.tolist(), [255, 0, 1])
+
+    def test_matches_fixedint(self) -> None:
+        Int8 = FixedInt(8, signed=True)
+        a = list(range(-128, 128, 7))
+        b = list(range(127, -129, -7))
+        expected = [Int8(x) * Int8(y) for x, y in zip(a, b)]
+        self.assertEqual(self.Int8Array.mul(a, b).tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
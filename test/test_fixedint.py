@@ -5,7 +5,10 @@
 Unit tester program for the FixedInt class factory.
 """
 
+import operator
 import unittest
+from decimal import Decimal
+from fractions import Fraction
 from typing import Any, Callable, Type
 
 from fixedint import FixedInt, FixedIntType
@@ -70,6 +73,11 @@ class TestFixedInt(unittest.TestCase):
     def test_not_equals_combos(self) -> None:
         self._assert_not_equals_combos(12, Int8)
 
+    def test_not_equals_negative(self) -> None:
+        self.assertFalse(Int8(-1) != -1)
+        self.assertFalse(-1 != Int8(-1))
+        self.assertTrue(Int8(-1) != 255)
+
     def _assert_all_cmps(self, num1: int, num2: int) -> None:
         self.assertLess(num1, num2)
         self.assertGreater(num2, num1)
@@ -93,6 +101,29 @@ class TestFixedInt(unittest.TestCase):
         num2 = Int8(17)
         self._assert_all_cmps(num1, num2)
 
+    def test_hash(self) -> None:
+        self.assertEqual(hash(Int8(-1)), hash(-1))
+        self.assertEqual(hash(UInt8(255)), hash(255))
+        lookup = {-1: "negative one"}
+        self.assertEqual(lookup[Int8(255)], "negative one")
+
+    def test_int_conversion(self) -> None:
+        self.assertEqual(int(Int8(-88)), -88)
+        self.assertIs(type(int(Int8(-88))), int)
+        self.assertEqual(int(UInt8(-88)), 168)
+
+    def test_index_uses_raw_bits(self) -> None:
+        # int subclasses cannot override __index__, so unlike int(),
+        # operator.index() and everything built on it see the raw bits.
+        self.assertEqual(operator.index(Int8(-1)), 255)
+        self.assertEqual(hex(Int8(-1)), "0xff")
+        self.assertEqual(int(Int8(-1)), -1)
+
+    def test_init_matches_int_conversion(self) -> None:
+        for fixed in (Int8(-1), Int8(100), UInt8(200), Int12(-1000)):
+            for cls in (Int8, UInt8, Int12, UInt12):
+                self.assertEqual(cls(fixed), cls(int(fixed)))
+
     def test_init_overflow(self) -> None:
         num = Int8(200)
         self.assertEqual(num, -56)
@@ -145,6 +176,20 @@ class TestFixedInt(unittest.TestCase):
     def test_mod_combos(self) -> None:
         self._assert_operation_combos(56, 3, lambda x, y: x % y, Int8)
 
+    def test_other_numeric_operand(self) -> None:
+        result = Int8(100) + Decimal(100)
+        self.assertEqual(result, -56)
+        self.assertIs(type(result), Int8)
+        result = Int8(100) + Fraction(1, 2)
+        self.assertEqual(result, 100)
+        self.assertIs(type(result), Int8)
+
+    def test_unsupported_operand(self) -> None:
+        with self.assertRaises(TypeError):
+            Int8(5) + "5"  # type: ignore
+        with self.assertRaises(TypeError):
+            "5" - Int8(5)  # type: ignore
+
     def test_add_overflow(self) -> None:
         num1 = Int8(100)
         num2 = Int8(150)
@@ -155,9 +200,25 @@ class TestFixedInt(unittest.TestCase):
         num2 = Int8(-150)
         self.assertEqual(num1 + num2, 6)
 
+    def test_same_type_overflow(self) -> None:
+        self.assertEqual(UInt12(5) - UInt12(10), UInt12.MAX_VALUE - 4)
+        self.assertEqual(Int12(2047) * Int12(2), -2)
+        self.assertIs(type(Int12(2047) * Int12(2)), Int12)
+
+    def test_init_non_int(self) -> None:
+        self.assertEqual(Int8(3.9), 3)
+        self.assertEqual(Int8(-129.5), 127)
+        self.assertEqual(UInt8("300"), 44)
+
     def test_nested_init(self) -> None:
         self.assertEqual(Int8(Int8(-267)), -11)
 
+    def test_cross_size_init(self) -> None:
+        self.assertEqual(Int12(Int8(-1)), -1)
+        self.assertEqual(UInt12(Int8(-1)), UInt12.MAX_VALUE)
+        self.assertEqual(Int12(UInt8(255)), 255)
+        self.assertEqual(Int8(Int12(-1000)), Int8(-1000))
+
     def _assert_cross_fixed_combos(self,
                                    fixed1: FixedIntType,
                                    fixed2: FixedIntType,
@@ -204,6 +265,34 @@ class TestFixedInt(unittest.TestCase):
         fixed2 = UInt12(100)
         self._assert_cross_fixed_combos(fixed1, fixed2, lambda x, y: x // y)
 
+    def test_add_cross_fixed_signed(self) -> None:
+        fixed1 = Int8(-1)
+        fixed2 = Int12(5)
+        self._assert_cross_fixed_combos(fixed1, fixed2, lambda x, y: x + y)
+        self.assertEqual(Int12(0) + Int8(-1), -1)
+
+    def test_sub_cross_fixed_signed(self) -> None:
+        fixed1 = Int8(-100)
+        fixed2 = Int12(-1500)
+        self._assert_cross_fixed_combos(fixed1, fixed2, lambda x, y: x - y)
+
+    def test_mul_cross_fixed_signed(self) -> None:
+        fixed1 = Int8(-3)
+        fixed2 = Int12(700)
+        self._assert_cross_fixed_combos(fixed1, fixed2, lambda x, y: x * y)
+
+    def test_div_cross_fixed_signed(self) -> None:
+        self.assertEqual(Int12(100) / Int8(-4), -25)
+        self.assertEqual(Int12(100) // Int8(-3), -34)
+        self.assertEqual(Int12(100) % Int8(-3), -2)
+        self.assertEqual(UInt12(100) // Int8(-4), UInt12(-25))
+
+    def test_reflected_signed(self) -> None:
+        result = 5 + Int8(-1)
+        self.assertEqual(result, 4)
+        self.assertIs(type(result), int)
+        self.assertEqual(100 // Int8(-4), -25)
+
     def test_neg_signed(self) -> None:
         fixed = Int12(700)
         self.assertEqual(-fixed, -700)
@@ -222,6 +311,29 @@ class TestFixedInt(unittest.TestCase):
         self.assertIsInstance(fixed, FixedIntType)
         self.assertIsInstance(fixed, int)
 
+    def test_value_internment(self) -> None:
+        self.assertIs(Int8(-5), Int8(251))
+        self.assertIs(UInt8(3) + UInt8(4), UInt8(7))
+
+    def test_no_instance_dict(self) -> None:
+        fixed = Int12(1000)
+        with self.assertRaises(AttributeError):
+            fixed.__dict__
+        with self.assertRaises(AttributeError):
+            fixed.foo = "bar"  # type: ignore
+
+    def test_abstract_base(self) -> None:
+        with self.assertRaises(TypeError):
+            FixedIntType(5)
+
+        class Custom(FixedIntType):
+            pass
+
+        with self.assertRaises(NotImplementedError):
+            Custom(5).as_decimal()
+        with self.assertRaises(NotImplementedError):
+            Custom(5).as_binary()
+
     def test_type_internment(self) -> None:
         fixed1 = FixedInt(36, signed=False)(450)
         fixed2 = FixedInt(36, signed=False)(2744)